@@ -13,6 +13,8 @@ from Crypto.Util.Padding import pad, unpad
 from Crypto.Hash import SHA256
 from Crypto.Random import get_random_bytes
 
+import utils
+
 
 def get_key(password):
     """
@@ -39,14 +41,14 @@ def encrypt_message(data, password):
     to ensure that identical plaintexts produce different ciphertexts.
 
     Args:
-        data (bytes): The raw file data (including header) to be encrypted.
+        data (bytes | bytearray | memoryview | str | file-like): The raw file data
+            (including header) to be encrypted.
         password (str): The password used to derive the encryption key.
 
     Returns:
         bytes: A byte sequence containing the IV (first 16 bytes) followed by the ciphertext.
     """
-    if isinstance(data, str):
-        data = data.encode('utf-8')
+    data = utils.to_bytes(data)
 
     key = get_key(password)
     iv = get_random_bytes(16)
@@ -66,13 +68,16 @@ def decrypt_message(encrypted_data, password):
     to decrypt the remaining ciphertext.
 
     Args:
-        encrypted_data (bytes): The byte sequence containing IV + Ciphertext.
+        encrypted_data (bytes | bytearray | memoryview | file-like): The byte
+            sequence containing IV + Ciphertext.
         password (str): The password used for decryption.
 
     Returns:
         bytes: The raw decrypted data (original file bytes).
         bytes: Returns b"ERROR" if decryption fails (wrong password or padding error).
     """
+    encrypted_data = utils.to_bytes(encrypted_data)
+
     try:
         key = get_key(password)
         iv = encrypted_data[:16]
@@ -1,10 +1,8 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-import crypto
-import stego
+import worker
 import os
-import struct
-import threading
+import shutil
 import sys
 import re
 import webbrowser
@@ -52,6 +50,9 @@ class App(ctk.CTk):
         self.secret_file_path = None
         self.encrypted_image_path = None
 
+        self.worker = worker.StegoWorker()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         self.password_var = ctk.StringVar()
         self.password_var.trace_add("write", self.check_password_realtime)
 
@@ -88,6 +89,11 @@ class App(ctk.CTk):
         self.lbl_footer.bind("<Enter>", lambda e: self.lbl_footer.configure(text_color="#3B8ED0"))
         self.lbl_footer.bind("<Leave>", lambda e: self.lbl_footer.configure(text_color="gray50"))
 
+    def on_close(self):
+        """Stops the background worker process and closes the window."""
+        self.worker.shutdown()
+        self.destroy()
+
     def open_github(self):
         """Opens developer GitHub profile."""
         webbrowser.open("https://github.com/tturkayy")
@@ -260,8 +266,8 @@ class App(ctk.CTk):
 
     def start_embedding_thread(self):
         """
-        Validates input, password, file selections and launches
-        the embedding process in a background thread.
+        Validates input, password, file selections and hands
+        the embedding job over to the background worker process.
         """
         if not self.target_image_path or not self.secret_file_path:
             messagebox.showerror("Error", "Please select an image and a file.")
@@ -282,80 +288,76 @@ class App(ctk.CTk):
             return
 
         self.lock_ui(True)
-        threading.Thread(target=self.run_embedding, args=(save_path,)).start()
+        self.worker.submit_embed(self.target_image_path, self.secret_file_path, password, save_path)
+        self.poll_worker(self.finish_embedding)
 
-    def run_embedding(self, save_path):
+    def finish_embedding(self, error, result):
         """
-        Reads secret file, prepares payload, encrypts it,
-        and embeds encrypted bytes into the cover image.
+        Reports the outcome of an embedding job once the worker is done.
         """
         try:
-            sifre = self.entry_pass_hide.get()
-            with open(self.secret_file_path, "rb") as f:
-                file_bytes = f.read()
-
-            filename = os.path.basename(self.secret_file_path).encode('utf-8')
-            header = struct.pack('I', len(filename))
-            full_payload = header + filename + file_bytes
-
-            self.lbl_status.configure(text="Encrypting data...")
-            encrypted_payload = crypto.encrypt_message(full_payload, sifre)
-
-            self.lbl_status.configure(text="Embedding data into pixels...")
-            stego.encode_image(self.target_image_path, encrypted_payload, save_path, self.update_progress_gui)
-
-            messagebox.showinfo("Success", "Data encrypted and embedded successfully!")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed: {e}")
+            if error is not None:
+                messagebox.showerror("Error", f"Failed: {error}")
+            else:
+                messagebox.showinfo("Success", "Data encrypted and embedded successfully!")
         finally:
             self.lock_ui(False)
 
     def start_extracting_thread(self):
         """
-        Launches the extraction process in a background thread
-        after basic validation.
+        Hands the extraction job over to the background worker
+        process after basic validation.
         """
         if not self.encrypted_image_path or not self.entry_pass_reveal.get():
             messagebox.showerror("Error", "Image and password are required.")
             return
 
         self.lock_ui(True)
-        threading.Thread(target=self.run_extracting).start()
+        self.worker.submit_extract(self.encrypted_image_path, self.entry_pass_reveal.get())
+        self.poll_worker(self.finish_extracting)
 
-    def run_extracting(self):
+    def finish_extracting(self, error, result):
         """
-        Reads embedded cipher bytes from the selected image,
-        decrypts them using the user-provided password,
-        reconstructs original file and prompts user to save it.
+        Prompts user to save the file recovered by the worker,
+        moving it out of its temporary location.
         """
         try:
-            sifre = self.entry_pass_reveal.get()
-
-            self.lbl_status.configure(text="Scanning image bits...")
-            encrypted_data = stego.decode_image(self.encrypted_image_path, self.update_progress_gui)
-
-            self.lbl_status.configure(text="Decrypting data...")
-            decrypted_payload = crypto.decrypt_message(encrypted_data, sifre)
-
-            if decrypted_payload == b"ERROR":
-                raise Exception("Invalid Password or Corrupted Data!")
-
-            filename_len = struct.unpack('I', decrypted_payload[:4])[0]
-            filename = decrypted_payload[4: 4 + filename_len].decode('utf-8')
-            file_data = decrypted_payload[4 + filename_len:]
-
-            save_path = filedialog.asksaveasfilename(initialfile=filename, title="Save Extracted File")
-            if save_path:
-                with open(save_path, "wb") as f:
-                    f.write(file_data)
-
-                messagebox.showinfo("Success", f"File extracted: {filename}")
+            if error is not None:
+                raise Exception(error)
+
+            filename, temp_path = result
+            try:
+                save_path = filedialog.asksaveasfilename(initialfile=filename, title="Save Extracted File")
+                if save_path:
+                    shutil.move(temp_path, save_path)
+                    messagebox.showinfo("Success", f"File extracted: {filename}")
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
 
         except Exception as e:
             messagebox.showerror("Error", f"{e}")
         finally:
             self.lock_ui(False)
 
+    def poll_worker(self, on_finish):
+        """
+        Drains status/progress events from the worker process on the
+        Tk event loop and calls on_finish(error, result) when the job ends.
+        """
+        for kind, value in self.worker.poll():
+            if kind == "status":
+                self.lbl_status.configure(text=value)
+            elif kind == "progress":
+                self.update_progress_gui(value)
+            elif kind == "done":
+                on_finish(None, value)
+                return
+            elif kind == "error":
+                on_finish(value, None)
+                return
+
+        self.after(50, self.poll_worker, on_finish)
 
 if __name__ == "__main__":
     app = App()
@@ -8,8 +8,9 @@ It initializes the Graphical User Interface (GUI) and starts the main event loop
 Application Overview:
 ---------------------
 StegoCrypt allows users to securely encrypt files using AES-256 and hide them
-within PNG images using Least Significant Bit (LSB) manipulation. It features
-a multi-threaded architecture to ensure a responsive user experience.
+within PNG images using Least Significant Bit (LSB) manipulation. Heavy
+embedding/extraction work runs in a separate worker process to ensure a
+responsive user experience.
 
 Metadata:
 ---------
@@ -32,6 +33,7 @@ Run this script directly to launch the application:
 """
 
 import sys
+import multiprocessing
 from gui import App
 
 def main():
@@ -46,4 +48,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Required so the worker process can start from a PyInstaller executable.
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
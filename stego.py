@@ -9,8 +9,90 @@ Author: Turkay Yildirim
 License: MIT
 """
 
+import io
+import os
+import threading
+from collections import OrderedDict
+
 from PIL import Image
 
+import utils
+
+# Default upper bound for the decoded cover cache (256 MB of raw RGB data).
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class CoverCache:
+    """
+    Bounded LRU cache of decoded cover images.
+
+    Stores the raw RGB pixel buffer of each cover keyed by its absolute path
+    and validated against the file's modification time, size and inode, so
+    a replaced file is picked up even if its mtime was preserved. Repeatedly
+    embedding into the same cover skips the open/decode/convert steps.
+    Entries are evicted least-recently-used first once the total size of the
+    cached buffers exceeds `max_bytes`.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path -> (signature, size, raw_bytes)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, image_path):
+        """
+        Returns (size, raw RGB bytes) for the image, decoding it on a miss.
+
+        The returned bytes object is immutable and shared with the cache;
+        callers must copy it (e.g. into a bytearray) before modifying pixels.
+        """
+        path = os.path.abspath(image_path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                if entry[0] == signature:
+                    self._entries.move_to_end(path)
+                    return entry[1], entry[2]
+                # The file changed on disk, drop the stale buffer
+                self._discard(path)
+
+        with Image.open(path) as img:
+            img = img.convert("RGB")
+            size = img.size
+            raw = img.tobytes()
+
+        with self._lock:
+            if len(raw) <= self.max_bytes:
+                self._discard(path)
+                self._entries[path] = (signature, size, raw)
+                self._current_bytes += len(raw)
+                while self._current_bytes > self.max_bytes:
+                    _, (_, _, old_raw) = self._entries.popitem(last=False)
+                    self._current_bytes -= len(old_raw)
+
+        return size, raw
+
+    def _discard(self, path):
+        """Removes a single entry. Caller must hold the lock."""
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._current_bytes -= len(entry[2])
+
+    def clear(self):
+        """Drops every cached cover image."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+
+# Shared cache used by encode_image(). Lives for the lifetime of the process,
+# so the persistent GUI worker reuses covers across jobs.
+cover_cache = CoverCache()
+
 
 def data_to_bin(data):
     """Converts various data types (int, str, bytes) into binary string representation."""
@@ -30,100 +112,140 @@ def bin_to_bytes(binary_data):
     return bytearray([int(byte, 2) for byte in all_bytes])
 
 
-def encode_image(image_path, secret_data, output_path, progress_callback=None):
+def _open_image(source):
     """
-    Embeds binary data into the LSBs of the provided image.
+    Opens an image from a path, a bytes-like object or a readable binary stream.
+
+    Raw buffers (bytes, bytearray, memoryview) are wrapped in an in-memory
+    stream so callers never need a temporary file on disk.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    return Image.open(source)
 
-    Implements an 'Early Exit' optimization: The loop breaks immediately after
-    all data bits are embedded, copying the remaining pixels in bulk to save time.
+
+def _embed_pixels(size, cover_pixels, secret_data, progress_callback=None):
+    """
+    Embeds binary data into a raw RGB pixel buffer.
 
     Args:
-        image_path (str): Path to the cover image.
+        size (tuple): (width, height) of the cover image.
+        cover_pixels (bytes): Raw RGB bytes of the cover. Never modified.
         secret_data (bytes): The encrypted data to hide.
-        output_path (str): Where to save the resulting PNG.
         progress_callback (func): Optional function to update UI progress bar.
 
     Returns:
-        bool: True if successful.
+        PIL.Image.Image: The encoded RGB image, not yet saved.
     """
-    img = Image.open(image_path)
-    img = img.convert("RGB")
-
     # Data Preparation
+    # Normalize to bytes first so the size header counts bytes, not
+    # characters or memoryview items.
+    secret_data = utils.to_bytes(secret_data)
+
     data_len = len(secret_data)
     bin_length = format(data_len, '032b')  # First 32 bits = Data Size
     bin_data = data_to_bin(secret_data)
     full_payload = bin_length + bin_data
     payload_len = len(full_payload)
 
-    width, height = img.size
+    width, height = size
     total_pixels = width * height
 
     if payload_len > total_pixels * 3:
         raise ValueError("Error: Image is too small to hold this data.")
 
-    pixels = list(img.getdata())
-    encoded_pixels = []
+    # Private copy of the cover buffer. Raw RGB bytes are laid out
+    # R, G, B, R, G, B..., i.e. exactly in payload bit order.
+    channels = bytearray(cover_pixels)
 
-    payload_index = 0
+    # Report progress in roughly 1% steps to prevent UI lag
+    progress_step = max(1, payload_len // 100)
 
     # --- Encoding Loop with Optimization ---
-    for i, (r, g, b) in enumerate(pixels):
+    # Only the first payload_len channels are touched; the rest of the
+    # copied buffer is already the untouched remainder of the image.
+    for i in range(payload_len):
+        channels[i] = (channels[i] & 0xFE) | int(full_payload[i])
 
-        # Optimization: If all data is written, copy the rest and break
-        if payload_index >= payload_len:
-            encoded_pixels.extend(pixels[i:])
-            break
+        if progress_callback and i % progress_step == 0:
+            progress_callback(i / payload_len)
 
-        # Modify LSBs of Red, Green, and Blue channels
-        if payload_index < payload_len:
-            r = (r & 0xFE) | int(full_payload[payload_index])
-            payload_index += 1
+    return Image.frombytes("RGB", size, channels)
 
-        if payload_index < payload_len:
-            g = (g & 0xFE) | int(full_payload[payload_index])
-            payload_index += 1
 
-        if payload_index < payload_len:
-            b = (b & 0xFE) | int(full_payload[payload_index])
-            payload_index += 1
+def encode_image(image_path, secret_data, output_path, progress_callback=None):
+    """
+    Embeds binary data into the LSBs of the provided image.
 
-        encoded_pixels.append((r, g, b))
+    Implements an 'Early Exit' optimization: Only the channels that carry data
+    bits are visited; the remaining pixels are copied in bulk to save time.
+    The decoded cover is served from `cover_cache`, so repeated embeds into the
+    same unchanged image skip decoding it again.
 
-        # Update progress every 50k pixels to prevent UI lag
-        if progress_callback and i % 50000 == 0:
-            current_percent = payload_index / payload_len
-            progress_callback(current_percent)
+    Args:
+        image_path (str): Path to the cover image.
+        secret_data (bytes): The encrypted data to hide.
+        output_path (str): Where to save the resulting PNG.
+        progress_callback (func): Optional function to update UI progress bar.
+
+    Returns:
+        bool: True if successful.
+    """
+    size, cached_pixels = cover_cache.get(image_path)
+    new_img = _embed_pixels(size, cached_pixels, secret_data, progress_callback)
 
     # Save the new image
     if progress_callback: progress_callback(0.99)
 
-    new_img = Image.new(img.mode, img.size)
-    new_img.putdata(encoded_pixels)
     new_img.save(output_path, "PNG")
 
     if progress_callback: progress_callback(1.0)
     return True
 
 
-def decode_image(image_path, progress_callback=None):
+def encode_image_bytes(cover, secret_data, output=None, progress_callback=None):
     """
-    Extracts hidden data from the LSBs of an image.
+    In-memory variant of encode_image() that never touches the filesystem.
 
-    Uses a two-step reading process:
-    1. Reads the first 32 bits (Header) to determine data size.
-    2. Reads only the required number of pixels to extract the payload.
+    The cover is decoded straight from memory and bypasses `cover_cache`,
+    which is keyed by file path and modification time.
 
     Args:
-        image_path (str): Path to the encoded image.
+        cover (bytes | bytearray | memoryview | file-like): The cover image data
+            or a readable binary stream containing it.
+        secret_data (bytes | bytearray | memoryview | file-like): The encrypted
+            data to hide.
+        output (file-like): Optional writable binary stream for the PNG.
         progress_callback (func): Optional function to update UI progress bar.
 
     Returns:
-        bytes: The extracted raw encrypted data.
+        bytes: The stego PNG when no output stream is given.
+        None: When the PNG was written to `output` instead.
     """
-    img = Image.open(image_path)
-    img = img.convert("RGB")
-    pixels = list(img.getdata())
+    with _open_image(cover) as img:
+        img = img.convert("RGB")
+        size = img.size
+        cover_pixels = img.tobytes()
+
+    new_img = _embed_pixels(size, cover_pixels, secret_data, progress_callback)
+
+    if progress_callback: progress_callback(0.99)
+
+    if output is None:
+        buffer = io.BytesIO()
+        new_img.save(buffer, "PNG")
+        result = buffer.getvalue()
+    else:
+        new_img.save(output, "PNG")
+        result = None
+
+    if progress_callback: progress_callback(1.0)
+    return result
+
+
+def _extract_pixels(img, progress_callback=None):
+    """Reads the length header and payload bits out of an opened image."""
+    pixels = list(img.convert("RGB").getdata())
 
     # Step 1: Read Header (First 32 bits)
     # We need approx 11 pixels (11 * 3 = 33 bits) to get 32 bits
@@ -165,3 +287,38 @@ def decode_image(image_path, progress_callback=None):
     if progress_callback: progress_callback(1.0)
 
     return bin_to_bytes(extracted_bin)
+
+
+def decode_image(image_path, progress_callback=None):
+    """
+    Extracts hidden data from the LSBs of an image.
+
+    Uses a two-step reading process:
+    1. Reads the first 32 bits (Header) to determine data size.
+    2. Reads only the required number of pixels to extract the payload.
+
+    Args:
+        image_path (str): Path to the encoded image.
+        progress_callback (func): Optional function to update UI progress bar.
+
+    Returns:
+        bytes: The extracted raw encrypted data.
+    """
+    with Image.open(image_path) as img:
+        return _extract_pixels(img, progress_callback)
+
+
+def decode_image_bytes(stego_image, progress_callback=None):
+    """
+    In-memory variant of decode_image() that never touches the filesystem.
+
+    Args:
+        stego_image (bytes | bytearray | memoryview | file-like): The encoded
+            PNG data or a readable binary stream containing it.
+        progress_callback (func): Optional function to update UI progress bar.
+
+    Returns:
+        bytes: The extracted raw encrypted data.
+    """
+    with _open_image(stego_image) as img:
+        return _extract_pixels(img, progress_callback)
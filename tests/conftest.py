@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+# The application modules live flat in the repository root
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture
+def cover_path(tmp_path):
+    """A small noisy RGB cover image saved as PNG."""
+    path = tmp_path / "cover.png"
+    Image.effect_noise((120, 80), 60).convert("RGB").save(path)
+    return str(path)
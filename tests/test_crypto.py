@@ -0,0 +1,21 @@
+import io
+
+import pytest
+
+import crypto
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+def test_encrypt_decrypt_round_trip_for_buffer_inputs(wrap):
+    encrypted = crypto.encrypt_message(wrap(b"secret payload"), "pw")
+    assert crypto.decrypt_message(wrap(encrypted), "pw") == b"secret payload"
+
+
+def test_decrypt_with_wrong_password_returns_error():
+    encrypted = crypto.encrypt_message(b"secret payload", "pw")
+    assert crypto.decrypt_message(encrypted, "other") == b"ERROR"
+
+
+def test_text_stream_is_rejected():
+    with pytest.raises(TypeError, match="Unsupported data type."):
+        crypto.encrypt_message(io.StringIO("text"), "pw")
@@ -0,0 +1,138 @@
+import io
+import os
+from array import array
+
+from PIL import Image
+
+import stego
+
+
+def reference_encode(cover_path, secret_data):
+    """Straightforward per-channel LSB embedding used as a ground truth."""
+    with Image.open(cover_path) as img:
+        channels = list(img.convert("RGB").tobytes())
+
+    payload = format(len(secret_data), '032b') + ''.join(format(b, "08b") for b in secret_data)
+    for i, bit in enumerate(payload):
+        channels[i] = (channels[i] & 0xFE) | int(bit)
+    return bytes(channels)
+
+
+def write_solid_png(path, color, size=(4, 4)):
+    Image.new("RGB", size, color).save(path)
+    return str(path)
+
+
+def test_encode_matches_reference_and_round_trips(cover_path, tmp_path):
+    secret = os.urandom(600)
+    output_path = str(tmp_path / "out.png")
+
+    assert stego.encode_image(cover_path, secret, output_path) is True
+    with Image.open(output_path) as img:
+        assert img.tobytes() == reference_encode(cover_path, secret)
+    assert bytes(stego.decode_image(output_path)) == secret
+
+
+def test_encode_reports_intermediate_progress_for_small_payloads(cover_path, tmp_path):
+    progress = []
+    stego.encode_image(cover_path, os.urandom(100), str(tmp_path / "out.png"), progress.append)
+
+    intermediate = [value for value in progress if 0 < value < 0.99]
+    assert len(intermediate) > 50
+    assert progress[-1] == 1.0
+
+
+def test_cover_cache_hit_returns_same_buffer(tmp_path):
+    cache = stego.CoverCache()
+    path = write_solid_png(tmp_path / "a.png", (1, 2, 3))
+
+    first = cache.get(path)
+    assert first == ((4, 4), bytes([1, 2, 3]) * 16)
+    assert cache.get(path)[1] is first[1]
+
+
+def test_cover_cache_evicts_least_recently_used(tmp_path):
+    entry_bytes = 4 * 4 * 3
+    cache = stego.CoverCache(max_bytes=entry_bytes * 2)
+    paths = [write_solid_png(tmp_path / f"{n}.png", (n, n, n)) for n in range(3)]
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])  # Refresh, so paths[1] becomes the LRU entry
+    cache.get(paths[2])
+
+    assert list(cache._entries) == [os.path.abspath(paths[0]), os.path.abspath(paths[2])]
+    assert cache._current_bytes == entry_bytes * 2
+
+
+def test_cover_cache_skips_entries_over_budget(tmp_path):
+    cache = stego.CoverCache(max_bytes=10)
+    path = write_solid_png(tmp_path / "big.png", (9, 9, 9))
+
+    assert cache.get(path)[1] == bytes([9, 9, 9]) * 16
+    assert not cache._entries
+    assert cache._current_bytes == 0
+
+
+def test_cover_cache_detects_modified_file(tmp_path):
+    cache = stego.CoverCache()
+    path = write_solid_png(tmp_path / "a.png", (1, 1, 1))
+    cache.get(path)
+
+    write_solid_png(path, (5, 5, 5))
+    os.utime(path, ns=(1, 1))
+    assert cache.get(path)[1] == bytes([5, 5, 5]) * 16
+    assert cache._current_bytes == 4 * 4 * 3
+
+
+def test_cover_cache_detects_replacement_with_preserved_mtime(tmp_path):
+    cache = stego.CoverCache()
+    path = write_solid_png(tmp_path / "a.png", (1, 1, 1))
+    original = os.stat(path)
+    cache.get(path)
+
+    # Swap in a new file and restore the old mtime, as 'rsync -t' would
+    replacement = write_solid_png(tmp_path / "b.png", (5, 5, 5), size=(6, 6))
+    os.replace(replacement, path)
+    os.utime(path, ns=(original.st_atime_ns, original.st_mtime_ns))
+    assert cache.get(path) == ((6, 6), bytes([5, 5, 5]) * 36)
+
+
+def test_bytes_api_matches_path_api(cover_path, tmp_path):
+    secret = os.urandom(300)
+    output_path = str(tmp_path / "out.png")
+    stego.encode_image(cover_path, secret, output_path)
+
+    with open(cover_path, "rb") as f:
+        cover = f.read()
+    png = stego.encode_image_bytes(memoryview(cover), secret)
+
+    with open(output_path, "rb") as f:
+        assert png == f.read()
+    assert bytes(stego.decode_image_bytes(png)) == secret
+    assert bytes(stego.decode_image_bytes(io.BytesIO(png))) == secret
+
+
+def test_bytes_api_writes_to_stream(cover_path):
+    with open(cover_path, "rb") as f:
+        cover = io.BytesIO(f.read())
+
+    output = io.BytesIO()
+    assert stego.encode_image_bytes(cover, b"hello", output) is None
+    assert bytes(stego.decode_image_bytes(output.getvalue())) == b"hello"
+
+
+def test_secret_data_is_normalized_before_size_header(cover_path, tmp_path):
+    with open(cover_path, "rb") as f:
+        cover = f.read()
+
+    items = array('I', [1, 2])
+    png = stego.encode_image_bytes(cover, memoryview(items))
+    assert bytes(stego.decode_image_bytes(png)) == items.tobytes()
+
+    output_path = str(tmp_path / "out.png")
+    stego.encode_image(cover_path, "hello", output_path)
+    assert bytes(stego.decode_image(output_path)) == b"hello"
+
+    png = stego.encode_image_bytes(cover, io.BytesIO(b"stream"))
+    assert bytes(stego.decode_image_bytes(png)) == b"stream"
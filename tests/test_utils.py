@@ -0,0 +1,24 @@
+import io
+from array import array
+
+import pytest
+
+import utils
+
+
+@pytest.mark.parametrize("data, expected", [
+    (b"abc", b"abc"),
+    ("héllo", "héllo".encode('utf-8')),
+    (bytearray(b"abc"), b"abc"),
+    (memoryview(b"abc"), b"abc"),
+    (memoryview(array('I', [1, 2])), array('I', [1, 2]).tobytes()),
+    (io.BytesIO(b"abc"), b"abc"),
+])
+def test_to_bytes_accepted_types(data, expected):
+    assert utils.to_bytes(data) == expected
+
+
+@pytest.mark.parametrize("data", [io.StringIO("text"), 42, None])
+def test_to_bytes_rejects_unsupported_types(data):
+    with pytest.raises(TypeError, match="Unsupported data type."):
+        utils.to_bytes(data)
@@ -0,0 +1,100 @@
+import os
+import queue
+import struct
+import time
+
+import pytest
+
+import worker
+
+
+def wait_for_result(stego_worker, timeout=60):
+    """Polls the worker until a job finishes and returns all its events."""
+    events = []
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        for event in stego_worker.poll():
+            events.append(event)
+            if event[0] in ("done", "error"):
+                return events
+        time.sleep(0.05)
+    raise AssertionError("Worker did not finish in time.")
+
+
+def test_embed_and_extract_round_trip(cover_path, tmp_path):
+    secret_path = tmp_path / "secret.txt"
+    secret_path.write_bytes(os.urandom(500))
+    output_path = str(tmp_path / "out.png")
+
+    stego_worker = worker.StegoWorker()
+    try:
+        stego_worker.submit_embed(cover_path, str(secret_path), "Passw0rd!", output_path)
+        events = wait_for_result(stego_worker)
+        assert events[-1] == ("done", output_path)
+        assert ("status", "Embedding data into pixels...") in events
+        assert any(kind == "progress" for kind, _ in events)
+
+        stego_worker.submit_extract(output_path, "Passw0rd!")
+        kind, (filename, temp_path) = wait_for_result(stego_worker)[-1]
+        assert kind == "done"
+        assert filename == "secret.txt"
+        with open(temp_path, "rb") as f:
+            assert f.read() == secret_path.read_bytes()
+
+        stego_worker.submit_extract(output_path, "WrongPass1!")
+        assert wait_for_result(stego_worker)[-1] == ("error", "Invalid Password or Corrupted Data!")
+    finally:
+        stego_worker.shutdown()
+
+
+def test_shutdown_removes_unclaimed_extracted_files(cover_path, tmp_path):
+    secret_path = tmp_path / "secret.txt"
+    secret_path.write_bytes(b"plaintext")
+    output_path = str(tmp_path / "out.png")
+
+    stego_worker = worker.StegoWorker()
+    stego_worker.submit_embed(cover_path, str(secret_path), "Passw0rd!", output_path)
+    wait_for_result(stego_worker)
+
+    stego_worker.submit_extract(output_path, "Passw0rd!")
+    temp_dir = stego_worker._temp_dir
+    deadline = time.time() + 60
+    while not os.listdir(temp_dir) and time.time() < deadline:
+        time.sleep(0.05)
+
+    # The result is never polled, as when the window closes mid-job
+    stego_worker.shutdown()
+    assert not os.path.exists(temp_dir)
+
+
+def test_worker_loop_error_message_is_never_empty(monkeypatch):
+    def fail(emit):
+        raise MemoryError()
+
+    monkeypatch.setitem(worker.JOBS, "fail", fail)
+    jobs, events = queue.Queue(), queue.Queue()
+    jobs.put(("fail", ()))
+    jobs.put(None)
+
+    worker._worker_loop(jobs, events)
+    assert events.get_nowait() == ("error", "MemoryError")
+
+
+def test_extract_file_removes_temp_file_on_write_failure(cover_path, tmp_path, monkeypatch):
+    import crypto
+    import stego
+
+    payload = struct.pack('I', 5) + b"a.txt" + b"data"
+    stego.encode_image(cover_path, crypto.encrypt_message(payload, "pw"), str(tmp_path / "out.png"))
+
+    def failing_fdopen(fd, mode):
+        os.close(fd)
+        raise OSError(28, "No space left on device")
+
+    temp_dir = tmp_path / "extract"
+    temp_dir.mkdir()
+    monkeypatch.setattr(worker.os, "fdopen", failing_fdopen)
+
+    with pytest.raises(OSError):
+        worker.extract_file(str(tmp_path / "out.png"), "pw", str(temp_dir), lambda kind, value: None)
+    assert os.listdir(temp_dir) == []
@@ -0,0 +1,43 @@
+"""
+StegoCrypt Utility Module
+-------------------------
+Small helpers shared by the cryptography and steganography modules.
+
+Author: Turkay Yildirim
+License: MIT
+"""
+
+
+def to_bytes(data):
+    """
+    Normalizes the accepted data input types into a bytes object.
+
+    Supports bytes, str (UTF-8 encoded), any buffer object such as bytearray
+    or memoryview, and readable binary streams, so callers can pass in-memory
+    buffers without copying them to temporary files first. Buffers are copied
+    byte for byte, so multi-byte memoryview items are never truncated.
+
+    Args:
+        data: The input to normalize.
+
+    Returns:
+        bytes: The raw bytes of the input.
+
+    Raises:
+        TypeError: If the type is unsupported or a stream returns text.
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    if hasattr(data, "read"):
+        data = data.read()
+        if isinstance(data, bytes):
+            return data
+        if not isinstance(data, (bytearray, memoryview)):
+            raise TypeError("Unsupported data type.")
+
+    try:
+        return memoryview(data).tobytes()
+    except TypeError:
+        raise TypeError("Unsupported data type.") from None
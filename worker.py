@@ -0,0 +1,222 @@
+"""
+StegoCrypt Worker Module
+------------------------
+Runs the CPU-bound embedding and extraction pipelines in a persistent child
+process. The pixel loops in the stego module are pure Python and hold the GIL,
+so running them in a thread freezes the GUI event loop; a separate process
+keeps the interface responsive.
+
+Only file paths and short messages travel between the processes. Progress,
+status and results come back as small event tuples on a queue, while bulk
+data (the secret file, the cover image, the extracted payload) is exchanged
+through the filesystem instead of being pickled.
+
+Author: Turkay Yildirim
+License: MIT
+"""
+
+import multiprocessing
+import os
+import queue
+import shutil
+import struct
+import tempfile
+
+import crypto
+import stego
+
+
+def embed_file(image_path, secret_file_path, password, output_path, emit):
+    """
+    Encrypts a file and embeds it into the cover image.
+
+    Args:
+        image_path (str): Path to the cover image.
+        secret_file_path (str): Path to the file that will be hidden.
+        password (str): The password used to derive the encryption key.
+        output_path (str): Where to save the resulting PNG.
+        emit (func): Callback receiving (kind, value) event tuples.
+
+    Returns:
+        str: The path of the written stego image.
+    """
+    with open(secret_file_path, "rb") as f:
+        file_bytes = f.read()
+
+    filename = os.path.basename(secret_file_path).encode('utf-8')
+    header = struct.pack('I', len(filename))
+    full_payload = header + filename + file_bytes
+
+    emit("status", "Encrypting data...")
+    encrypted_payload = crypto.encrypt_message(full_payload, password)
+
+    emit("status", "Embedding data into pixels...")
+    stego.encode_image(image_path, encrypted_payload, output_path,
+                       lambda value: emit("progress", value))
+    return output_path
+
+
+def extract_file(image_path, password, temp_dir, emit):
+    """
+    Extracts and decrypts the file hidden inside a stego image.
+
+    The recovered file is written to a temporary file so that large payloads
+    never have to be pickled back to the GUI process.
+
+    Args:
+        image_path (str): Path to the encoded image.
+        password (str): The password used for decryption.
+        temp_dir (str): Directory that will hold the recovered file.
+        emit (func): Callback receiving (kind, value) event tuples.
+
+    Returns:
+        tuple: (original filename, path of the temporary file holding its data).
+    """
+    emit("status", "Scanning image bits...")
+    encrypted_data = stego.decode_image(image_path, lambda value: emit("progress", value))
+
+    emit("status", "Decrypting data...")
+    decrypted_payload = crypto.decrypt_message(encrypted_data, password)
+
+    if decrypted_payload == b"ERROR":
+        raise Exception("Invalid Password or Corrupted Data!")
+
+    filename_len = struct.unpack('I', decrypted_payload[:4])[0]
+    filename = decrypted_payload[4: 4 + filename_len].decode('utf-8')
+
+    fd, temp_path = tempfile.mkstemp(prefix="stegocrypt_", suffix=".bin", dir=temp_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(memoryview(decrypted_payload)[4 + filename_len:])
+    except BaseException:
+        # Never leave partially written plaintext behind
+        os.remove(temp_path)
+        raise
+
+    return filename, temp_path
+
+
+JOBS = {
+    "embed": embed_file,
+    "extract": extract_file,
+}
+
+
+def _worker_loop(jobs, events):
+    """
+    Main loop of the worker process.
+
+    Receives (job_name, args) tuples until a None sentinel arrives and reports
+    each job back as a stream of ("status" | "progress", value) events followed
+    by exactly one ("done", result) or ("error", message) event.
+    """
+    def emit(kind, value):
+        events.put((kind, value))
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+
+        name, args = job
+        try:
+            result = JOBS[name](*args, emit)
+            emit("done", result)
+        except Exception as e:
+            # Some exceptions (e.g. MemoryError) carry an empty message
+            emit("error", str(e) or type(e).__name__)
+
+
+class StegoWorker:
+    """
+    Handle to a persistent worker process executing embed/extract jobs.
+
+    The process is started lazily on the first submitted job and reused for
+    subsequent ones. Only one job is expected to be in flight at a time; the
+    caller drains its events with `poll()`.
+
+    Extracted files are written to a private temporary directory that is
+    removed by `shutdown()`, so decrypted data never outlives the handle even
+    if a job is interrupted.
+    """
+
+    def __init__(self):
+        # 'spawn' behaves the same on every platform and avoids forking a
+        # process that already has a Tk interpreter loaded.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._process = None
+        self._jobs = None
+        self._events = None
+        self._temp_dir = None
+
+    def _ensure_started(self):
+        """Starts (or restarts) the worker process if it is not running."""
+        if self._process is not None and self._process.is_alive():
+            return
+
+        self._jobs = self._ctx.Queue()
+        self._events = self._ctx.Queue()
+        self._process = self._ctx.Process(target=_worker_loop, args=(self._jobs, self._events), daemon=True)
+        self._process.start()
+
+    def submit_embed(self, image_path, secret_file_path, password, output_path):
+        """Queues an embedding job. Its result is the output image path."""
+        self._ensure_started()
+        self._jobs.put(("embed", (image_path, secret_file_path, password, output_path)))
+
+    def submit_extract(self, image_path, password):
+        """Queues an extraction job. Its result is a (filename, temp_path) tuple."""
+        self._ensure_started()
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix="stegocrypt_")
+        self._jobs.put(("extract", (image_path, password, self._temp_dir)))
+
+    def poll(self):
+        """
+        Returns all events currently available without blocking.
+
+        If the worker process died unexpectedly, an ("error", message) event
+        is appended so the caller never waits forever for a result.
+        """
+        events = []
+        if self._process is None:
+            return events
+
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+
+        if not events and not self._process.is_alive():
+            events.append(("error", f"Worker process exited unexpectedly (code {self._process.exitcode})."))
+            self._process = None
+
+        return events
+
+    def shutdown(self):
+        """
+        Asks the worker process to exit and waits briefly for it.
+
+        Results that were never picked up are discarded and the temporary
+        directory, including any extracted file still inside it, is removed.
+        """
+        if self._process is not None:
+            if self._process.is_alive():
+                self._jobs.put(None)
+                self._process.join(timeout=2)
+                if self._process.is_alive():
+                    self._process.terminate()
+                    self._process.join()
+
+            for kind, value in self.poll():
+                if kind == "done" and isinstance(value, tuple):
+                    _, temp_path = value
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+
+            self._process = None
+
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None